@@ -1,38 +1,68 @@
 import argparse
+import atexit
+import collections
 import logging
 import os
 import sys
 import re
-from typing import List, Tuple, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Tuple, Optional
 import io
+import subprocess
+import tempfile
+import functools
+import glob
+import math
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 
 try:
-    from PIL import Image
+    from PIL import Image, ImageStat
 except ImportError:
     print("Pillow is not installed. Please install it with: pip install Pillow")
     sys.exit(1)
 
-try:
-    import pytesseract
-except ImportError:
-    print("pytesseract is not installed. Please install it with: pip install pytesseract")
-    sys.exit(1)
-
-try:
-    from pdf2image import convert_from_path
-except ImportError:
-    print("pdf2image is not installed. Please install it with: pip install pdf2image")
-    sys.exit(1)
-
-try:
+if TYPE_CHECKING:
+    # Imported lazily at runtime, see _faker and _tesserocr.
     from faker import Faker
-except ImportError:
-    print("Faker is not installed. Please install it with: pip install Faker")
-    sys.exit(1)
+    from tesserocr import PyTessBaseAPI
 
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Faker logs every provider it localizes at DEBUG; keep that out of --verbose output.
+logging.getLogger("faker").setLevel(logging.INFO)
+
+# Supported input file extensions (lower case, including the dot).
+_IMG_EXTS = frozenset({".png", ".jpg", ".jpeg", ".tiff", ".bmp"})
+_PDF_EXTS = frozenset({".pdf"})
+
+# Keys of the word data dicts returned by the OCR functions; each holds one entry per word.
+_WORD_DATA_KEYS = ("text", "left", "top", "width", "height", "conf", "block_num", "par_num", "line_num")
+
+# Words recognized with a confidence at or below this value are left alone.
+MIN_WORD_CONFIDENCE = 60
+
+# Image modes redaction boxes are drawn in directly; anything else is converted to RGB first.
+_REDACTION_MODES = frozenset({"1", "L", "RGB"})
+
+# Images are downscaled so that their longest side is at most this many pixels before OCR.
+MAX_OCR_DIMENSION = 4000
+
+# JPEG inputs are decoded for OCR at the smallest DCT scale that keeps both sides at least this large.
+JPEG_DRAFT_SIZE = 2500
+
+# Redacted pages are mostly untouched scans; zlib level 1 is several times faster than the
+# default level 6 for a slightly larger file.
+PNG_SAVE_OPTIONS = {"compress_level": 1, "optimize": False}
+
+# Pages rendered to the temporary directory and OCR'd per tesseract run when tesserocr is not installed.
+# Bounds temporary disk (possibly tmpfs) use while still amortizing tesseract's start-up over several pages.
+BATCH_OCR_PAGES = 8
+
+# Number of redacted pages a PDF worker may have queued for writing while it OCRs the next ones.
+MAX_PENDING_SAVES = 2
+
+# Escapes that RE2 matches against ASCII only, whereas `re` matches them against Unicode.
+_ASCII_ONLY_IN_RE2 = frozenset({"\\w", "\\W", "\\d", "\\D", "\\s", "\\S", "\\b", "\\B"})
 
 def setup_argparse() -> argparse.ArgumentParser:
     """
@@ -42,39 +72,367 @@ def setup_argparse() -> argparse.ArgumentParser:
         argparse.ArgumentParser: The argument parser object.
     """
     parser = argparse.ArgumentParser(description="Replaces text recognized by OCR in images or PDFs with placeholder text.")
-    parser.add_argument("input_file", help="The input image or PDF file.")
-    parser.add_argument("-o", "--output_file", help="The output image or PDF file. If not specified, the input file will be overwritten.", required=False)
-    parser.add_argument("-r", "--replacement_text", default="REDACTED", help="The text to replace the OCR'd text with.  Defaults to 'REDACTED'.", required=False)
+    parser.add_argument("input_file", nargs="?", help="The input image or PDF file. Not used with --batch.")
+    parser.add_argument("-o", "--output_file", help="The output image or PDF file (the output directory with --batch). If not specified, the input file will be overwritten.", required=False)
+    parser.add_argument("-r", "--replacement_text", default="REDACTED", help="The text to replace the OCR'd text with.  Defaults to 'REDACTED'. Matched text is always blacked out in the output image; the replaced text is logged with --verbose.", required=False)
     parser.add_argument("-l", "--language", default="eng", help="The language to use for OCR. Defaults to 'eng' (English).", required=False)
     parser.add_argument("-d", "--dpi", type=int, default=200, help="The DPI to use when converting PDFs to images. Defaults to 200.", required=False)
-    parser.add_argument("-p", "--pattern", help="A regular expression pattern to match text to be replaced. If not provided, all OCR'd text will be replaced.", required=False)
-    parser.add_argument("-f", "--fake", action="store_true", help="Use Faker to generate realistic replacement text (e.g., names, addresses). Overrides --replacement_text.", required=False)
+    parser.add_argument("-p", "--pattern", help="A regular expression pattern to match text to be replaced, matched against each OCR'd line. If not provided, all OCR'd text will be replaced.", required=False)
+    parser.add_argument("-f", "--fake", action="store_true", help="Use Faker to generate realistic replacement text (e.g., names, addresses). Overrides --replacement_text. Like --replacement_text, only visible in the --verbose log.", required=False)
     parser.add_argument("--faker_locale", default="en_US", help="Locale to use for Faker (e.g., 'en_US', 'fr_FR').  Only applicable if --fake is used.", required=False)
+    parser.add_argument("--fake_provider", default="name", help="Faker provider used to replace pattern matches (e.g., 'name', 'address', 'ssn', 'email'). Defaults to 'name'. Only applicable if --fake is used. The image is redacted with black boxes either way; the replaced text is logged with --verbose.", required=False)
+    parser.add_argument("-b", "--batch", help="Process every supported image and PDF in this directory instead of a single input file.", required=False)
+    parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging, including the replaced text of each page.", required=False)
+    parser.add_argument("-w", "--workers", type=int, help="Number of worker processes for PDF pages and --batch files. Defaults to the number of CPUs.", required=False)
 
 
     return parser
 
 
-def ocr_image(image: Image.Image, language: str = "eng") -> str:
+@functools.lru_cache(maxsize=None)
+def _tesserocr():
+    """
+    Imports tesserocr on first use. It is optional: it binds tesseract's C++ API directly, so images
+    are handed over in memory (pip install tesserocr).
+
+    Returns:
+        module: The tesserocr module, or None if it is not installed.
+    """
+    try:
+        import tesserocr
+    except ImportError:
+        return None
+    return tesserocr
+
+
+@functools.lru_cache(maxsize=None)
+def _re2():
+    """
+    Imports RE2 on first use. It is optional: it gives linear-time matching for user-supplied
+    patterns (pip install google-re2).
+
+    Returns:
+        module: The re2 module, or None if it is not installed.
+    """
+    try:
+        import re2
+    except ImportError:
+        return None
+    return re2
+
+
+def _import_pytesseract():
+    """
+    Imports pytesseract on first use. It imports numpy (and pandas, if installed) itself, so
+    loading it at module level would undo the lazy numpy import for --help.
+
+    Returns:
+        module: The pytesseract module.
+    """
+    try:
+        import pytesseract
+    except ImportError:
+        print("pytesseract is not installed. Please install it with: pip install pytesseract")
+        sys.exit(1)
+    return pytesseract
+
+
+def _import_numpy():
+    """
+    Imports numpy on first use, so that --help does not pay for it.
+
+    Returns:
+        module: The numpy module.
+    """
+    try:
+        import numpy
+    except ImportError:
+        print("numpy is not installed. Please install it with: pip install numpy")
+        sys.exit(1)
+    return numpy
+
+
+# tesserocr API instances, one per language, kept alive for the lifetime of the process so the
+# language data is loaded only once.
+_api_cache: Dict[str, "PyTessBaseAPI"] = {}
+
+
+def _tesseract_api(language: str) -> "PyTessBaseAPI":
+    """
+    Returns this process's tesserocr API instance for a language, initializing it on first use.
+
+    Args:
+        language (str): The language to use for OCR.
+
+    Returns:
+        PyTessBaseAPI: The API instance.
+    """
+    api = _api_cache.get(language)
+    if api is None:
+        api = _api_cache[language] = _tesserocr().PyTessBaseAPI(lang=language)
+    return api
+
+
+@atexit.register
+def _close_tesseract_apis() -> None:
+    """
+    Releases the cached tesserocr API instances.
+    """
+    for api in _api_cache.values():
+        api.End()
+    _api_cache.clear()
+
+
+def _init_worker(language: str, fake: bool, faker_locale: str, log_level: int) -> None:
+    """
+    Initializer for pool worker processes: loads the OCR engine (and Faker, if its output will be logged) once, before the first page arrives.
+
+    Args:
+        language (str): The language to use for OCR.
+        fake (bool): Whether Faker will be used.
+        faker_locale (str): The Faker locale.
+        log_level (int): The parent's log level. Workers started with "spawn" re-import this module and would reset it to INFO.
+    """
+    logging.getLogger().setLevel(log_level)
+    if _tesserocr() is not None:
+        _tesseract_api(language)
+    if fake and logging.getLogger().isEnabledFor(logging.DEBUG):
+        # Faker is only used to log the replaced text; don't pay its import otherwise.
+        _faker(faker_locale)
+
+
+def _run_tasks(function: Callable, tasks: Iterable, workers: int, language: str, fake: bool, faker_locale: str) -> Iterator:
+    """
+    Maps a function over tasks in a pool of worker processes, yielding results in task order.
+
+    With a single worker the tasks run in the current process instead of a pool.
+
+    Args:
+        function (Callable): A picklable, module-level function taking one task.
+        tasks (Iterable): The tasks.
+        workers (int): The number of worker processes.
+        language (str): The language for OCR, loaded by each worker up front.
+        fake (bool): Whether Faker will be used.
+        faker_locale (str): The Faker locale.
+
+    Returns:
+        Iterator: The results of `function`, in task order.
+    """
+    log_level = logging.getLogger().level
+    if workers <= 1:
+        _init_worker(language, fake, faker_locale, log_level)
+        yield from map(function, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(language, fake, faker_locale, log_level)) as executor:
+        yield from executor.map(function, tasks)
+
+
+def _tesserocr_data(image: Image.Image, language: str) -> Dict[str, List]:
+    """
+    Performs OCR through tesserocr, returning word data in the same layout as `pytesseract.image_to_data`.
+
+    Args:
+        image (Image.Image): The image to process.
+        language (str): The language to use for OCR.
+
+    Returns:
+        dict: Parallel lists under the keys in _WORD_DATA_KEYS.
+    """
+    data = {key: [] for key in _WORD_DATA_KEYS}
+    tesserocr = _tesserocr()
+    api = _tesseract_api(language)
+    api.SetImage(image)
+    api.Recognize()
+    iterator = api.GetIterator()
+    if iterator is None:
+        return data
+    block_num = par_num = line_num = 0
+    for word in tesserocr.iterate_level(iterator, tesserocr.RIL.WORD):
+        # Number blocks, paragraphs and lines the way image_to_data does, so words can be grouped into lines.
+        if word.IsAtBeginningOf(tesserocr.RIL.BLOCK):
+            block_num, par_num, line_num = block_num + 1, 0, 0
+        if word.IsAtBeginningOf(tesserocr.RIL.PARA):
+            par_num, line_num = par_num + 1, 0
+        if word.IsAtBeginningOf(tesserocr.RIL.TEXTLINE):
+            line_num += 1
+        box = word.BoundingBox(tesserocr.RIL.WORD)
+        if box is None:
+            continue
+        x1, y1, x2, y2 = box
+        data["text"].append(word.GetUTF8Text(tesserocr.RIL.WORD))
+        data["left"].append(x1)
+        data["top"].append(y1)
+        data["width"].append(x2 - x1)
+        data["height"].append(y2 - y1)
+        data["conf"].append(word.Confidence(tesserocr.RIL.WORD))
+        data["block_num"].append(block_num)
+        data["par_num"].append(par_num)
+        data["line_num"].append(line_num)
+    return data
+
+
+def ocr_data(image: Image.Image, language: str = "eng") -> Dict[str, List]:
     """
-    Performs OCR on an image.
+    Performs OCR on an image, returning the recognized words together with their bounding boxes.
+
+    Uses tesserocr when it is installed, which passes the pixels to tesseract in memory;
+    otherwise pytesseract, which writes the image to a temporary file for the tesseract CLI.
 
     Args:
         image (Image.Image): The image to process.
         language (str): The language to use for OCR.
 
     Returns:
-        str: The OCR'd text.
+        dict: Word data, with parallel lists under the keys in _WORD_DATA_KEYS (pytesseract adds a few more).
+    """
+    try:
+        if _tesserocr() is not None:
+            return _tesserocr_data(image, language)
+        pytesseract = _import_pytesseract()
+        return pytesseract.image_to_data(image, lang=language, output_type=pytesseract.Output.DICT)
+    except Exception as e:
+        logging.error(f"Error during OCR: {e}")
+        raise
+
+
+def ocr_data_batch(image_paths: List[str], language: str = "eng") -> List[Dict[str, List]]:
+    """
+    Performs OCR on several image files with a single tesseract run, so the engine and its
+    language data are initialized once for all of them.
+
+    Args:
+        image_paths (list): Paths of the images to process.
+        language (str): The language to use for OCR.
+
+    Returns:
+        list: One word data dict per image, in the layout returned by `ocr_data`.
     """
+    pytesseract = _import_pytesseract()
     try:
-        text = pytesseract.image_to_string(image, lang=language)
-        return text
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Given a text file instead of an image, tesseract processes every image listed in it.
+            list_path = os.path.join(tmp_dir, "imagelist.txt")
+            with open(list_path, "w") as list_file:
+                list_file.write("\n".join(image_paths) + "\n")
+            result = subprocess.run([pytesseract.pytesseract.tesseract_cmd, list_path, "-", "-l", language, "tsv"],
+                                    capture_output=True, check=True)
+    except FileNotFoundError as e:
+        # Otherwise reported by the callers as a missing input file.
+        logging.error(f"Error during OCR: tesseract not found: {pytesseract.pytesseract.tesseract_cmd}")
+        raise pytesseract.TesseractNotFoundError() from e
+    except subprocess.CalledProcessError as e:
+        logging.error(f"Error during OCR: {e.stderr.decode(errors='replace').strip()}")
+        raise
     except Exception as e:
         logging.error(f"Error during OCR: {e}")
         raise
 
+    return _parse_tsv(result.stdout.decode("utf-8"), len(image_paths))
+
+
+def _parse_tsv(tsv: str, page_count: int) -> List[Dict[str, List]]:
+    """
+    Splits tesseract's TSV output for several images into one word data dict per image.
+
+    Args:
+        tsv (str): The TSV output, including its header row.
+        page_count (int): The number of images tesseract was given.
+
+    Returns:
+        list: One word data dict per image, in the layout returned by `ocr_data`.
+    """
+    pages = [{key: [] for key in _WORD_DATA_KEYS} for _ in range(page_count)]
+    lines = tsv.splitlines()
+    if not lines:
+        return pages
+    header = lines[0].split("\t")
+    for line in lines[1:]:
+        row = dict(zip(header, line.split("\t")))
+        if "page_num" not in row:
+            continue
+        page = pages[int(row["page_num"]) - 1]
+        page["text"].append(row.get("text", ""))
+        for key in ("left", "top", "width", "height", "block_num", "par_num", "line_num"):
+            page[key].append(int(row[key]))
+        page["conf"].append(float(row["conf"]))
+    return pages
+
+
+def _preprocess(image: Image.Image) -> Image.Image:
+    """
+    Prepares an image for OCR: grayscale, downscaled if very large, and binarized.
+
+    Tesseract would grayscale and binarize the image itself; doing it here hands it far fewer bytes.
+    Grayscale happens first, so the downscale works on one byte per pixel instead of three.
+
+    Args:
+        image (Image.Image): The original image. It is not modified.
+
+    Returns:
+        Image.Image: A 1-bit image to run OCR on.
+    """
+    if image.mode == "1" and max(image.size) <= MAX_OCR_DIMENSION:
+        return image  # Already bitonal, e.g. a fax-style TIFF scan.
+    img = image if image.mode == "L" else image.convert("L")
+    if max(img.size) > MAX_OCR_DIMENSION:
+        factor = MAX_OCR_DIMENSION / max(img.size)
+        img = img.resize((max(1, round(img.width * factor)), max(1, round(img.height * factor))), Image.BILINEAR)
+    threshold = ImageStat.Stat(img).mean[0] * 0.9
+    return img.point(lambda p: 255 if p > threshold else 0, mode="1")
+
+
+@functools.lru_cache(maxsize=64)
+def _compiled(pattern: str):
+    """
+    Compiles a regular expression pattern once per process.
+
+    Uses RE2 when it is installed, so that arbitrary user patterns match in linear time.
+    Patterns RE2 cannot handle (backreferences, lookarounds) fall back to the standard `re` module,
+    and so do patterns using \\w, \\d, \\s, \\b or their negations: RE2 matches those against ASCII
+    only, which would split names such as "José Müller".
+
+    Args:
+        pattern (str): The regular expression pattern.
 
-def replace_text(text: str, replacement_text: str, pattern: Optional[str] = None, fake: bool = False, faker_locale: str = "en_US") -> str:
+    Returns:
+        The compiled pattern (an RE2 or `re` pattern object).
+    """
+    re2 = _re2()
+    if re2 is not None:
+        if any(escape.group() in _ASCII_ONLY_IN_RE2 for escape in re.finditer(r"\\.", pattern)):
+            logging.debug(f"Pattern uses character classes RE2 treats as ASCII-only, using re: {pattern}")
+        else:
+            options = re2.Options()
+            options.log_errors = False  # the fallback below is expected; don't print RE2's parse errors
+            try:
+                return re2.compile(pattern, options=options)
+            except re2.error:
+                logging.debug(f"Pattern not supported by RE2, falling back to re: {pattern}")
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=8)
+def _faker(locale: str) -> "Faker":
+    """
+    Returns a Faker instance for the locale, building it only once per process.
+
+    Faker is imported here rather than at module load, since it is only needed with --fake and imports slowly.
+
+    Args:
+        locale (str): The Faker locale.
+
+    Returns:
+        Faker: The Faker instance.
+    """
+    try:
+        from faker import Faker
+    except ImportError:
+        print("Faker is not installed. Please install it with: pip install Faker")
+        sys.exit(1)
+    return Faker(locale)
+
+
+def replace_text(text: str, replacement_text: str, pattern: Optional[str] = None, fake: bool = False, faker_locale: str = "en_US", fake_provider: str = "name") -> str:
     """
     Replaces text based on a pattern (optional) or replaces the entire text.
 
@@ -84,48 +442,220 @@ def replace_text(text: str, replacement_text: str, pattern: Optional[str] = None
         pattern (str, optional): A regular expression pattern to match. Defaults to None.
         fake (bool, optional): Whether to use Faker to generate replacement text. Defaults to False.
         faker_locale (str, optional): The Faker locale. Defaults to "en_US".
+        fake_provider (str, optional): The Faker provider generating replacements for pattern matches. Defaults to "name".
 
     Returns:
         str: The replaced text.
     """
     if fake:
-        fake_generator = Faker(faker_locale)
+        fake_generator = _faker(faker_locale)
         if pattern:
-             def replace_match(match):
-                 # Basic example: Replace matched text with a fake name
-                 return fake_generator.name()
-
-             replaced_text = re.sub(pattern, replace_match, text)
+             # Resolve the provider once rather than on every match, and splice the fake values in
+             # directly instead of having sub() call back into Python for each match.
+             fake_value = getattr(fake_generator, fake_provider)
+             parts = []
+             position = 0
+             for match in _compiled(pattern).finditer(text):
+                 parts.append(text[position:match.start()])
+                 parts.append(fake_value())
+                 position = match.end()
+             parts.append(text[position:])
+             replaced_text = "".join(parts)
         else:
             # If no pattern provided, replace the whole text with a fake sentence
             replaced_text = fake_generator.sentence()
     elif pattern:
-        replaced_text = re.sub(pattern, replacement_text, text)
+        replaced_text = _compiled(pattern).sub(replacement_text, text)
     else:
         replaced_text = replacement_text
 
     return replaced_text
 
 
-def create_redacted_image(image: Image.Image, ocr_text: str, replaced_text: str) -> Image.Image:
-  """
-  Creates a redacted image by drawing black boxes over the detected text.
+def find_text_boxes(data: Dict[str, List], pattern: Optional[str] = None, scale: float = 1.0) -> List[Tuple[int, int, int, int]]:
+    """
+    Selects the bounding boxes of the OCR'd words that should be redacted.
+
+    The pattern is matched against the text of each OCR'd line, its words joined by single spaces,
+    so patterns spanning several words (e.g. "John Smith") are found. Every word a match overlaps is selected.
+
+    Args:
+        data (dict): The word data returned by `ocr_data`.
+        pattern (str, optional): A regular expression pattern each line is matched against. If not provided, every word is selected.
+        scale (float, optional): Factor mapping OCR coordinates back onto the original image. Defaults to 1.0.
+
+    Returns:
+        list: (left, top, width, height) boxes of the selected words, in original image coordinates.
+    """
+    regex = _compiled(pattern) if pattern else None
+    lines = {}
+    for i, (word, conf) in enumerate(zip(data["text"], data["conf"])):
+        if not word.strip() or float(conf) <= MIN_WORD_CONFIDENCE:
+            continue
+        lines.setdefault((data["block_num"][i], data["par_num"][i], data["line_num"][i]), []).append(i)
+
+    selected = []
+    for indices in lines.values():
+        if regex is None:
+            selected.extend(indices)
+            continue
+        words = [data["text"][i].strip() for i in indices]
+        spans = []
+        position = 0
+        for word in words:
+            spans.append((position, position + len(word)))
+            position += len(word) + 1
+        matched = set()
+        for match in regex.finditer(" ".join(words)):
+            start, end = match.span()
+            for i, (word_start, word_end) in zip(indices, spans):
+                # An empty match selects the word it falls inside.
+                if (word_start < end and start < word_end) or word_start <= start < word_end:
+                    matched.add(i)
+        selected.extend(i for i in indices if i in matched)
+
+    boxes = []
+    for i in selected:
+        left, top, width, height = data["left"][i], data["top"][i], data["width"][i], data["height"][i]
+        if scale != 1.0:
+            # Round outwards so the scaled box still covers the whole word.
+            left, top, width, height = (math.floor(left * scale), math.floor(top * scale),
+                                        math.ceil(width * scale), math.ceil(height * scale))
+        boxes.append((left, top, width, height))
+    return boxes
+
+
+def draw_redaction_boxes(image: Image.Image, boxes: List[Tuple[int, int, int, int]]) -> Image.Image:
+    """
+    Creates a redacted copy of an image by drawing black boxes over the given regions.
+
+    Args:
+        image (Image.Image): The original image. It is not modified.
+        boxes (list): (left, top, width, height) boxes to black out.
+
+    Returns:
+        Image.Image: The redacted image.
+    """
+    # Grayscale and bitonal scans stay at one byte (or bit) per pixel instead of being widened to RGB.
+    # Each box is a single strided store into the pixel array, instead of a Python-level draw call.
+    pixels = _import_numpy().array(image if image.mode in _REDACTION_MODES else image.convert("RGB"))
+    for left, top, width, height in boxes:
+        pixels[top:top + height + 1, left:left + width + 1] = 0
+    return Image.fromarray(pixels)
+
+
+def save_image(image: Image.Image, path: str) -> None:
+    """
+    Saves an image, using fast compression settings when writing a PNG.
+
+    The image is encoded into memory and written with a single call, rather than in the many small
+    writes Pillow issues when saving to a file directly, which are slow on network shares.
+
+    Args:
+        image (Image.Image): The image to save.
+        path (str): The output path. The format is taken from its extension.
+    """
+    image_format = Image.registered_extensions().get(os.path.splitext(path)[1].lower())
+    if image_format is None:
+        raise ValueError(f"Unknown output file extension: {path}")
+    buffer = io.BytesIO()
+    if image_format == "PNG":
+        image.save(buffer, format=image_format, **PNG_SAVE_OPTIONS)
+    else:
+        image.save(buffer, format=image_format)
+    with open(path, "wb") as output_file:
+        output_file.write(buffer.getbuffer())
+
+
+def _save_in_background(io_pool: ThreadPoolExecutor, pending: "collections.deque[Future]", image: Image.Image, path: str) -> None:
+    """
+    Queues an image save on an I/O thread, so encoding and writing overlap with OCR of the next page.
+
+    Waits for the oldest queued saves once more than MAX_PENDING_SAVES are outstanding, to bound memory use.
+
+    Args:
+        io_pool (ThreadPoolExecutor): The I/O thread pool.
+        pending (collections.deque): Futures of the saves queued so far, oldest first.
+        image (Image.Image): The image to save. It must not be modified afterwards.
+        path (str): The output path.
+    """
+    pending.append(io_pool.submit(save_image, image, path))
+    while len(pending) > MAX_PENDING_SAVES:
+        pending.popleft().result()
+
+
+def find_redactions(image: Image.Image, language: str, replacement_text: str, pattern: Optional[str], fake: bool, faker_locale: str, fake_provider: str, original_width: Optional[int] = None) -> List[Tuple[int, int, int, int]]:
+    """
+    OCRs an image once and returns the boxes of the words matching the pattern (or all words if no pattern is given).
+
+    Args:
+        image (Image.Image): The image to OCR.
+        language (str): The language for OCR.
+        replacement_text (str): The text to replace with.
+        pattern (str, optional): The regex pattern.
+        fake (bool): Whether to use Faker.
+        faker_locale (str): The Faker locale.
+        fake_provider (str): The Faker provider generating replacements for pattern matches.
+        original_width (int, optional): Width of the image the boxes will be drawn on, if `image` is a reduced copy of it. Defaults to `image.width`.
+
+    Returns:
+        list: (left, top, width, height) boxes to black out.
+    """
+    ocr_input = _preprocess(image)
+    data = ocr_data(ocr_input, language)
+    return _select_redactions(data, replacement_text, pattern, fake, faker_locale, fake_provider, (original_width or image.width) / ocr_input.width)
+
 
-  Args:
-      image (Image.Image): The original image.
-      ocr_text (str): The original OCR'd text.
-      replaced_text (str): The text that replaced the original.  Not really used, but kept for potential extensions
+def _select_redactions(data: Dict[str, List], replacement_text: str, pattern: Optional[str], fake: bool, faker_locale: str, fake_provider: str, scale: float) -> List[Tuple[int, int, int, int]]:
+    """
+    Returns the boxes to black out, logging the replaced OCR'd text when debug logging is enabled.
 
-  Returns:
-      Image.Image: The redacted image.
-  """
-  # This simplified version creates a black image with the same dimensions.
-  # A more sophisticated version would identify the text location and redact only that part.
-  return Image.new("RGB", image.size, "black")
+    Args:
+        data (dict): The word data returned by `ocr_data` or `ocr_data_batch`.
+        replacement_text (str): The text to replace with.
+        pattern (str, optional): The regex pattern.
+        fake (bool): Whether to use Faker.
+        faker_locale (str): The Faker locale.
+        fake_provider (str): The Faker provider generating replacements for pattern matches.
+        scale (float): Factor mapping OCR coordinates back onto the original image.
 
+    Returns:
+        list: (left, top, width, height) boxes to black out.
+    """
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        # The replaced text is informational only; a failure here must not stop the page from being redacted.
+        ocr_text = " ".join(word for word in data["text"] if word.strip())
+        try:
+            replaced_text = replace_text(ocr_text, replacement_text, pattern, fake, faker_locale, fake_provider)
+        except Exception as e:
+            logging.debug(f"Could not build replaced text: {e}")
+        else:
+            logging.debug(f"Replaced text: {replaced_text}")
+    return find_text_boxes(data, pattern, scale=scale)
 
 
-def process_image(image_path: str, output_path: str, replacement_text: str, language: str, pattern: Optional[str], fake: bool, faker_locale: str) -> None:
+def redact_image(image: Image.Image, language: str, replacement_text: str, pattern: Optional[str], fake: bool, faker_locale: str, fake_provider: str) -> Image.Image:
+    """
+    OCRs an image once and blacks out the words matching the pattern (or all words if no pattern is given).
+
+    Args:
+        image (Image.Image): The image to redact.
+        language (str): The language for OCR.
+        replacement_text (str): The text to replace with.
+        pattern (str, optional): The regex pattern.
+        fake (bool): Whether to use Faker.
+        faker_locale (str): The Faker locale.
+        fake_provider (str): The Faker provider generating replacements for pattern matches.
+
+    Returns:
+        Image.Image: The redacted image.
+    """
+    boxes = find_redactions(image, language, replacement_text, pattern, fake, faker_locale, fake_provider)
+    return draw_redaction_boxes(image, boxes)
+
+
+
+def process_image(image_path: str, output_path: str, replacement_text: str, language: str, pattern: Optional[str], fake: bool, faker_locale: str, fake_provider: str) -> bool:
     """
     Processes a single image.
 
@@ -137,24 +667,112 @@ def process_image(image_path: str, output_path: str, replacement_text: str, lang
         pattern (str, optional): The regex pattern. Defaults to None.
         fake (bool, optional): Whether to use Faker. Defaults to False.
         faker_locale (str, optional): The Faker locale. Defaults to "en_US".
+        fake_provider (str, optional): The Faker provider generating replacements for pattern matches. Defaults to "name".
+
+    Returns:
+        bool: True if the redacted image was written, False if an error was logged.
     """
     try:
         image = Image.open(image_path)
-        ocr_text = ocr_image(image, language)
-        replaced_text = replace_text(ocr_text, replacement_text, pattern, fake, faker_locale)
-        redacted_image = create_redacted_image(image, ocr_text, replaced_text)
-        redacted_image.save(output_path)
+        if image.format == "JPEG":
+            # Let libjpeg decode straight to grayscale, at a reduced DCT scale for large scans, for the OCR pass.
+            original_width = image.width
+            image.draft("L", (JPEG_DRAFT_SIZE, JPEG_DRAFT_SIZE))
+            boxes = find_redactions(image, language, replacement_text, pattern, fake, faker_locale, fake_provider, original_width)
+            # The redacted output needs the full-resolution, full-color original. It is re-encoded even when
+            # nothing matched, so no output carries the input's EXIF/XMP/comment metadata.
+            redacted_image = draw_redaction_boxes(Image.open(image_path), boxes)
+        else:
+            redacted_image = redact_image(image, language, replacement_text, pattern, fake, faker_locale, fake_provider)
+        save_image(redacted_image, output_path)
         logging.info(f"Processed image: {image_path} -> {output_path}")
+        return True
     except FileNotFoundError:
         logging.error(f"Input file not found: {image_path}")
         sys.exit(1)
     except Exception as e:
         logging.error(f"Error processing image {image_path}: {e}")
+        return False
+
+
+def _import_pdf2image():
+    """
+    Imports pdf2image on first use, since it is only needed for PDF input.
+
+    Returns:
+        module: The pdf2image module.
+    """
+    try:
+        import pdf2image
+    except ImportError:
+        print("pdf2image is not installed. Please install it with: pip install pdf2image")
+        sys.exit(1)
+    return pdf2image
 
 
-def process_pdf(pdf_path: str, output_path: str, replacement_text: str, language: str, dpi: int, pattern: Optional[str], fake: bool, faker_locale: str) -> None:
+def _process_pages(args: Tuple[str, int, int, int, str, str, Optional[str], bool, str, str, str]) -> List[str]:
     """
-    Processes a PDF file.
+    Renders, redacts and saves a range of PDF pages. Runs in a worker process of the page pool.
+
+    With tesserocr, pages are rendered and OCR'd one at a time against the worker's long-lived API.
+    Otherwise the range is rendered to a temporary directory BATCH_OCR_PAGES pages at a time, and each
+    such chunk is OCR'd with a single tesseract run. Pages are written there as PNG rather than pdf2image's
+    default uncompressed PPM, since the temporary directory may be memory-backed (tmpfs).
+    Either way pages are decoded one at a time; redacted pages are written by background I/O threads,
+    with at most MAX_PENDING_SAVES of them waiting to be written.
+
+    Args:
+        args (tuple): (pdf_path, first_page, last_page, dpi, language, replacement_text, pattern, fake, faker_locale, fake_provider, base_name).
+
+    Returns:
+        list: The paths the redacted pages were written to, in page order.
+    """
+    pdf_path, first_page, last_page, dpi, language, replacement_text, pattern, fake, faker_locale, fake_provider, base_name = args
+    pdf2image = _import_pdf2image()
+    output_paths = [f"{base_name}_page_{page}.png" for page in range(first_page, last_page + 1)]  # Save as PNG for simplicity
+
+    pending = collections.deque()
+    with ThreadPoolExecutor(max_workers=MAX_PENDING_SAVES) as io_pool:
+        if _tesserocr() is not None:
+            for page, image_output_path in zip(range(first_page, last_page + 1), output_paths):
+                image = pdf2image.convert_from_path(pdf_path, dpi=dpi, first_page=page, last_page=page, thread_count=1)[0]
+                redacted_image = redact_image(image, language, replacement_text, pattern, fake, faker_locale, fake_provider)
+                _save_in_background(io_pool, pending, redacted_image, image_output_path)
+        else:
+            for chunk_first in range(first_page, last_page + 1, BATCH_OCR_PAGES):
+                chunk_last = min(chunk_first + BATCH_OCR_PAGES - 1, last_page)
+                chunk_output_paths = output_paths[chunk_first - first_page:chunk_last - first_page + 1]
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    page_paths = pdf2image.convert_from_path(pdf_path, dpi=dpi, first_page=chunk_first, last_page=chunk_last, thread_count=1,
+                                                             output_folder=tmp_dir, paths_only=True, fmt="png")
+                    ocr_paths = []
+                    scales = []
+                    for i, page_path in enumerate(page_paths):
+                        with Image.open(page_path) as image:
+                            ocr_input = _preprocess(image)
+                            scales.append(image.width / ocr_input.width)
+                        ocr_path = os.path.join(tmp_dir, f"ocr_{i}.png")
+                        # Pillow only writes the resolution when asked to; without it tesseract guesses the DPI.
+                        ocr_dpi = round(dpi / scales[-1])
+                        ocr_input.save(ocr_path, dpi=(ocr_dpi, ocr_dpi), **PNG_SAVE_OPTIONS)
+                        ocr_paths.append(ocr_path)
+
+                    for page_path, data, scale, image_output_path in zip(page_paths, ocr_data_batch(ocr_paths, language), scales, chunk_output_paths):
+                        boxes = _select_redactions(data, replacement_text, pattern, fake, faker_locale, fake_provider, scale)
+                        with Image.open(page_path) as image:
+                            redacted_image = draw_redaction_boxes(image, boxes)
+                        _save_in_background(io_pool, pending, redacted_image, image_output_path)
+        for future in pending:
+            future.result()
+    return output_paths
+
+
+def process_pdf(pdf_path: str, output_path: str, replacement_text: str, language: str, dpi: int, pattern: Optional[str], fake: bool, faker_locale: str, fake_provider: str, workers: Optional[int] = None) -> bool:
+    """
+    Processes a PDF file. Pages are rendered and OCR'd in parallel, by default one worker process per CPU.
+
+    With tesserocr each page is a separate task; otherwise every worker gets one contiguous range of
+    pages so that it starts tesseract only once.
 
     Args:
         pdf_path (str): The path to the input PDF.
@@ -165,23 +783,107 @@ def process_pdf(pdf_path: str, output_path: str, replacement_text: str, language
         pattern (str, optional): The regex pattern. Defaults to None.
         fake (bool, optional): Whether to use Faker. Defaults to False.
         faker_locale (str, optional): The Faker locale. Defaults to "en_US".
+        fake_provider (str, optional): The Faker provider generating replacements for pattern matches. Defaults to "name".
+        workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        bool: True if every page was written, False if an error was logged.
     """
     try:
-        images = convert_from_path(pdf_path, dpi=dpi)
+        page_count = _import_pdf2image().pdfinfo_from_path(pdf_path)["Pages"]
         base_name = os.path.splitext(output_path)[0]  # Remove .pdf extension if it exists.
-
-        for i, image in enumerate(images):
-            image_output_path = f"{base_name}_page_{i+1}.png" # Save as PNG for simplicity
-            ocr_text = ocr_image(image, language)
-            replaced_text = replace_text(ocr_text, replacement_text, pattern, fake, faker_locale)
-            redacted_image = create_redacted_image(image, ocr_text, replaced_text)
-            redacted_image.save(image_output_path)
-            logging.info(f"Processed PDF page {i+1}: {pdf_path} -> {image_output_path}")
+        workers = max(1, min(workers or os.cpu_count() or 1, page_count))
+        pages_per_task = 1 if _tesserocr() is not None else max(1, math.ceil(page_count / workers))
+
+        tasks = (
+            (pdf_path, first_page, min(first_page + pages_per_task - 1, page_count), dpi, language, replacement_text,
+             pattern, fake, faker_locale, fake_provider, base_name)
+            for first_page in range(1, page_count + 1, pages_per_task)
+        )
+        page = 0
+        for image_output_paths in _run_tasks(_process_pages, tasks, workers, language, fake, faker_locale):
+            for image_output_path in image_output_paths:
+                page += 1
+                logging.info(f"Processed PDF page {page}: {pdf_path} -> {image_output_path}")
+        return True
     except FileNotFoundError:
         logging.error(f"Input file not found: {pdf_path}")
         sys.exit(1)
     except Exception as e:
         logging.error(f"Error processing PDF {pdf_path}: {e}")
+        return False
+
+
+def _process_one(args: Tuple[str, str, str, str, int, Optional[str], bool, str, str, int]) -> bool:
+    """
+    Processes one file of a batch, dispatching on its extension. Runs in a worker process of the batch pool.
+
+    Errors are contained here, including the SystemExit process_image/process_pdf raise for a missing
+    file, so that one bad file does not cancel the rest of the batch.
+
+    Args:
+        args (tuple): (input_path, output_path, replacement_text, language, dpi, pattern, fake, faker_locale, fake_provider, pdf_workers).
+            pdf_workers is the number of page workers a PDF may use: the cores left over by the batch pool.
+
+    Returns:
+        bool: True if the file was processed successfully.
+    """
+    input_path, output_path, replacement_text, language, dpi, pattern, fake, faker_locale, fake_provider, pdf_workers = args
+    try:
+        if os.path.splitext(input_path)[1].lower() in _PDF_EXTS:
+            return process_pdf(input_path, output_path, replacement_text, language, dpi, pattern, fake, faker_locale, fake_provider, workers=pdf_workers)
+        return process_image(input_path, output_path, replacement_text, language, pattern, fake, faker_locale, fake_provider)
+    except (Exception, SystemExit) as e:
+        logging.error(f"Error processing {input_path}: {e!r}")
+        return False
+
+
+def process_batch(input_dir: str, output_dir: Optional[str], replacement_text: str, language: str, dpi: int, pattern: Optional[str], fake: bool, faker_locale: str, fake_provider: str, workers: Optional[int] = None) -> bool:
+    """
+    Processes every supported image and PDF in a directory, one file per worker process.
+
+    When there are fewer files than workers, the remaining workers are shared out as page workers
+    for the PDFs, so a batch of a few large PDFs still uses every core.
+
+    Args:
+        input_dir (str): The directory containing the input files.
+        output_dir (str, optional): The directory to write the outputs to. If not specified, the input files are overwritten.
+        replacement_text (str): The text to replace with.
+        language (str): The language for OCR.
+        dpi (int): The DPI for PDF conversion.
+        pattern (str, optional): The regex pattern. Defaults to None.
+        fake (bool, optional): Whether to use Faker. Defaults to False.
+        faker_locale (str, optional): The Faker locale. Defaults to "en_US".
+        fake_provider (str, optional): The Faker provider generating replacements for pattern matches. Defaults to "name".
+        workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        bool: True if every file was processed successfully.
+    """
+    input_paths = sorted(
+        path for path in glob.iglob(os.path.join(input_dir, "*"))
+        if os.path.isfile(path) and os.path.splitext(path)[1].lower() in _IMG_EXTS | _PDF_EXTS
+    )
+    if not input_paths:
+        logging.warning(f"No supported files found in: {input_dir}")
+        return True
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    total_workers = workers or os.cpu_count() or 1
+    workers = max(1, min(total_workers, len(input_paths)))
+    pdf_workers = max(1, total_workers // workers)
+    tasks = [
+        (path, os.path.join(output_dir, os.path.basename(path)) if output_dir else path,
+         replacement_text, language, dpi, pattern, fake, faker_locale, fake_provider, pdf_workers)
+        for path in input_paths
+    ]
+    succeeded = sum(_run_tasks(_process_one, tasks, workers, language, fake, faker_locale))
+    if succeeded == len(tasks):
+        logging.info(f"Processed {succeeded} files from {input_dir}")
+    else:
+        logging.error(f"Processed {succeeded} of {len(tasks)} files from {input_dir}; {len(tasks) - succeeded} failed")
+    return succeeded == len(tasks)
 
 
 def main() -> None:
@@ -190,6 +892,8 @@ def main() -> None:
     """
     parser = setup_argparse()
     args = parser.parse_args()
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
 
     input_file = args.input_file
     output_file = args.output_file if args.output_file else input_file  # Overwrite if not specified
@@ -199,25 +903,52 @@ def main() -> None:
     pattern = args.pattern
     fake = args.fake
     faker_locale = args.faker_locale
-
-    # Input validation: check if the locale is valid
-    try:
-        Faker(faker_locale)
-    except AttributeError:
-        logging.error(f"Invalid Faker locale: {faker_locale}")
-        sys.exit(1)
-
-
-
-    if not os.path.exists(input_file):
-        logging.error(f"Input file does not exist: {input_file}")
-        sys.exit(1)
-
-
-    if input_file.lower().endswith(('.png', '.jpg', '.jpeg', '.tiff', '.bmp')):
-        process_image(input_file, output_file, replacement_text, language, pattern, fake, faker_locale)
-    elif input_file.lower().endswith('.pdf'):
-        process_pdf(input_file, output_file, replacement_text, language, dpi, pattern, fake, faker_locale)
+    fake_provider = args.fake_provider
+    workers = args.workers
+
+    if bool(args.batch) == bool(input_file):
+        parser.error("exactly one of input_file or --batch is required")
+    if workers is not None and workers < 1:
+        parser.error("--workers must be at least 1")
+
+    # Input validation: check if the locale and provider are valid. Faker output only reaches the
+    # --verbose log, so skip importing it otherwise.
+    if fake and logging.getLogger().isEnabledFor(logging.DEBUG):
+        try:
+            fake_generator = _faker(faker_locale)
+        except AttributeError:
+            logging.error(f"Invalid Faker locale: {faker_locale}")
+            sys.exit(1)
+        # Generate one value up front: the provider must exist, take no arguments and produce text.
+        try:
+            sample = getattr(fake_generator, fake_provider)()
+        except (AttributeError, TypeError, ValueError):
+            sample = None
+        if not isinstance(sample, str):
+            logging.error(f"Invalid Faker provider (must take no arguments and return text): {fake_provider}")
+            sys.exit(1)
+
+    if args.batch:
+        if not os.path.isdir(args.batch):
+            logging.error(f"Batch directory does not exist: {args.batch}")
+            sys.exit(1)
+        if not process_batch(args.batch, args.output_file, replacement_text, language, dpi, pattern, fake, faker_locale, fake_provider, workers):
+            sys.exit(1)
+        return
+
+    extension = os.path.splitext(input_file)[1].lower()
+    if extension in _IMG_EXTS:
+        if workers is not None:
+            logging.warning("--workers has no effect on a single image")
+        # process_image reports a missing input file when opening it.
+        if not process_image(input_file, output_file, replacement_text, language, pattern, fake, faker_locale, fake_provider):
+            sys.exit(1)
+    elif extension in _PDF_EXTS:
+        if not os.path.exists(input_file):
+            logging.error(f"Input file does not exist: {input_file}")
+            sys.exit(1)
+        if not process_pdf(input_file, output_file, replacement_text, language, dpi, pattern, fake, faker_locale, fake_provider, workers):
+            sys.exit(1)
     else:
         logging.error("Unsupported file type.  Only images (png, jpg, jpeg, tiff, bmp) and PDFs are supported.")
         sys.exit(1)
@@ -0,0 +1,128 @@
+"""
+Tests for the word selection and TSV parsing in main.py. They use hand-built word data and canned
+tesseract output, so no tesseract binary is needed.
+"""
+import pytest
+
+import main
+
+
+def word_data(*lines):
+    """
+    Builds word data in the layout returned by `ocr_data`.
+
+    Args:
+        *lines: One list per OCR'd line of (text, conf) pairs. Words are laid out left to right,
+            10 pixels wide with a 5 pixel gap, and each line is 20 pixels below the previous one.
+
+    Returns:
+        dict: The word data.
+    """
+    data = {key: [] for key in main._WORD_DATA_KEYS}
+    for line_num, words in enumerate(lines, start=1):
+        for word_num, (text, conf) in enumerate(words):
+            data["text"].append(text)
+            data["conf"].append(conf)
+            data["left"].append(word_num * 15)
+            data["top"].append(line_num * 20)
+            data["width"].append(10)
+            data["height"].append(10)
+            data["block_num"].append(1)
+            data["par_num"].append(1)
+            data["line_num"].append(line_num)
+    return data
+
+
+def box(word_num, line_num):
+    return (word_num * 15, line_num * 20, 10, 10)
+
+
+def test_no_pattern_selects_every_confident_word():
+    data = word_data([("Dear", 95), ("John", 95)], [("Regards", 90)])
+    assert main.find_text_boxes(data) == [box(0, 1), box(1, 1), box(0, 2)]
+
+
+def test_low_confidence_and_empty_words_are_skipped():
+    data = word_data([("John", 95), ("Smith", main.MIN_WORD_CONFIDENCE), (" ", 95), ("Doe", -1)])
+    assert main.find_text_boxes(data) == [box(0, 1)]
+
+
+def test_multi_word_name_matches():
+    data = word_data([("Dear", 95), ("John", 95), ("Smith,", 95), ("thanks", 95)])
+    assert main.find_text_boxes(data, r"John Smith") == [box(1, 1), box(2, 1)]
+
+
+def test_multi_word_number_matches():
+    data = word_data([("SSN:", 95), ("123", 95), ("45", 95), ("6789", 95)])
+    assert main.find_text_boxes(data, r"\d{3} \d{2} \d{4}") == [box(1, 1), box(2, 1), box(3, 1)]
+
+
+def test_partial_word_match_selects_the_whole_word():
+    data = word_data([("Account:", 95), ("DE89370400", 95)])
+    assert main.find_text_boxes(data, r"8937") == [box(1, 1)]
+
+
+def test_match_does_not_span_lines():
+    data = word_data([("John", 95)], [("Smith", 95)])
+    assert main.find_text_boxes(data, r"John Smith") == []
+
+
+@pytest.mark.parametrize("pattern", [r" ", r"\s"])
+def test_match_on_the_separator_only_selects_nothing(pattern):
+    data = word_data([("John", 95), ("Smith", 95)])
+    assert main.find_text_boxes(data, pattern) == []
+
+
+def test_match_touching_the_separator_selects_only_the_overlapped_words():
+    data = word_data([("John", 95), ("Smith", 95), ("Jr", 95)])
+    assert main.find_text_boxes(data, r"n S") == [box(0, 1), box(1, 1)]
+
+
+def test_word_classes_match_unicode_letters():
+    data = word_data([("José", 95), ("Müller", 95), ("42", 95)])
+    assert main.find_text_boxes(data, r"[^\W\d]+ [^\W\d]+") == [box(0, 1), box(1, 1)]
+
+
+def test_scale_rounds_boxes_outwards():
+    data = {key: [] for key in main._WORD_DATA_KEYS}
+    for key, value in (("text", "John"), ("conf", 95), ("left", 3), ("top", 7), ("width", 5), ("height", 9),
+                       ("block_num", 1), ("par_num", 1), ("line_num", 1)):
+        data[key].append(value)
+    assert main.find_text_boxes(data, scale=1.5) == [(4, 10, 8, 14)]
+    assert main.find_text_boxes(data, scale=1.0) == [(3, 7, 5, 9)]
+
+
+TSV = "\n".join([
+    "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext",
+    "1\t1\t0\t0\t0\t0\t0\t0\t1700\t2200\t-1\t",
+    "5\t1\t1\t1\t1\t1\t100\t200\t80\t30\t96.5\tJohn",
+    "5\t1\t1\t1\t1\t2\t190\t200\t90\t30\t95.1\tSmith",
+    "1\t2\t0\t0\t0\t0\t0\t0\t1700\t2200\t-1\t",
+    "1\t3\t0\t0\t0\t0\t0\t0\t1700\t2200\t-1\t",
+    "5\t3\t2\t1\t3\t1\t50\t60\t70\t20\t91\t123-45-6789",
+]) + "\n"
+
+
+def test_parse_tsv_splits_pages_by_page_num():
+    pages = main._parse_tsv(TSV, 3)
+    assert len(pages) == 3
+    assert pages[0]["text"] == ["", "John", "Smith"]
+    assert pages[0]["left"] == [0, 100, 190]
+    assert pages[0]["conf"] == [-1.0, 96.5, 95.1]
+    assert pages[1]["text"] == [""]
+    assert pages[2]["text"] == ["", "123-45-6789"]
+    assert pages[2]["block_num"] == [0, 2]
+    assert pages[2]["line_num"] == [0, 3]
+    assert all(set(page) == set(main._WORD_DATA_KEYS) for page in pages)
+
+
+def test_parse_tsv_pages_feed_find_text_boxes():
+    pages = main._parse_tsv(TSV, 3)
+    assert main.find_text_boxes(pages[0], r"John Smith") == [(100, 200, 80, 30), (190, 200, 90, 30)]
+    assert main.find_text_boxes(pages[1], r"John Smith") == []
+    assert main.find_text_boxes(pages[2], r"\d{3}-\d{2}-\d{4}") == [(50, 60, 70, 20)]
+
+
+def test_parse_tsv_without_output_gives_empty_pages():
+    pages = main._parse_tsv("", 2)
+    assert pages == [{key: [] for key in main._WORD_DATA_KEYS}] * 2